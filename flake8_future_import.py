@@ -181,10 +181,24 @@ def main(args):
     choices = set('FI{0}'.format(choice) for choice in choices)
     parser.add_argument('--ignore', help='Ignore the given comma-separated '
                                          'codes')
+    parser.add_argument('--fail-fast', action='store_true',
+                        help='Stop at the first error which is not ignored')
+    parser.add_argument('--max-findings', type=int, default=0,
+                        help='Stop after the given number of errors which '
+                             'are not ignored')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help='Do not print any errors and only set the exit '
+                             'code (implies --fail-fast)')
     FutureImportChecker.add_arguments(parser)
     parser.add_argument('files', nargs='+')
     args = parser.parse_args(args)
     FutureImportChecker.parse_options(args)
+    if args.max_findings < 0:
+        raise ValueError('The maximum number of findings "{0}" must not be '
+                         'negative'.format(args.max_findings))
+    max_findings = args.max_findings
+    if args.fail_fast or args.quiet:
+        max_findings = 1
     if args.ignore:
         ignored = set(args.ignore.split(','))
         unrecognized = ignored - choices
@@ -205,16 +219,22 @@ def main(args):
                     '", "'.join(invalid)))
     else:
         ignored = set()
-    has_errors = False
+    findings = 0
     for filename in args.files:
         with open(filename, 'rb') as f:
             tree = parse(f.read(), filename=filename, mode='exec')
         for line, char, msg, checker in FutureImportChecker(tree,
                                                             filename).run():
             if msg[:4] not in ignored:
-                has_errors = True
-                print('{0}:{1}:{2}: {3}'.format(filename, line, char + 1, msg))
-    return has_errors
+                findings += 1
+                if not args.quiet:
+                    print('{0}:{1}:{2}: {3}'.format(filename, line, char + 1,
+                                                    msg))
+                # run() is a generator, so leaving the loop also skips the
+                # remaining features
+                if findings == max_findings:
+                    return True
+    return findings > 0
 
 
 if __name__ == '__main__':
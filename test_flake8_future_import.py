@@ -162,17 +162,22 @@ class TestMainPrintPatched(TestCaseBase):
         flake8_future_import.print = print
         super(TestMainPrintPatched, self).tearDown()
 
-    def run_main(self, *imported):
+    def call_main(self, options, *imported):
         self.messages = []
         code = generate_code(*imported)
         code = '#!/usr/bin/python\n# -*- coding: utf-8 -*-\n' + code
         handle, tmp_file = tempfile.mkstemp()
         try:
             os.write(handle, code.encode('utf-8'))
-            flake8_future_import.main([tmp_file])
+            return flake8_future_import.main(options + [tmp_file, tmp_file])
         finally:
             os.close(handle)
             os.remove(tmp_file)
+
+    def run_main(self, *imported):
+        self.call_main([], *imported)
+        # Both files are the same, so every error is reported twice
+        self.assertEqual(len(self.messages) % 2, 0)
         self.run_test(self.reverse_parse(self.messages), imported)
 
     def test_main(self):
@@ -183,6 +188,29 @@ class TestMainPrintPatched(TestCaseBase):
         self.run_main(['invalid_code'])
         self.run_main(['invalid_code', 'unicode_literals'])
 
+    def test_fail_fast(self):
+        self.assertTrue(self.call_main(['--fail-fast'], ['unicode_literals']))
+        self.assertEqual(len(self.messages), 1)
+        self.assertTrue(self.messages[0].endswith(
+            'FI54 __future__ import "unicode_literals" present'))
+
+    def test_max_findings(self):
+        self.assertTrue(self.call_main(['--max-findings', '3']))
+        self.assertEqual(len(self.messages), 3)
+        # More than the number of errors in both files
+        self.assertTrue(self.call_main(['--max-findings', '100']))
+        self.assertEqual(len(self.messages),
+                         2 * len(flake8_future_import.ALL_FEATURES))
+        self.assertRaises(ValueError, self.call_main, ['--max-findings', '-1'])
+
+    def test_quiet(self):
+        self.assertTrue(self.call_main(['--quiet']))
+        self.assertEqual(self.messages, [])
+        ignore = ','.join('FI{0}'.format(10 + feature.index)
+                          for feature in flake8_future_import.ALL_FEATURES)
+        self.assertFalse(self.call_main(['--quiet', '--ignore', ignore]))
+        self.assertEqual(self.messages, [])
+
 
 class BadSyntaxMetaClass(type):
 